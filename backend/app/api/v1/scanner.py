@@ -42,6 +42,12 @@ STATE_OK_NO_CANDIDATES = "ok_no_candidates"
 STATE_FAILED = "failed"
 STATE_SKIPPED = "skipped"
 
+# The session the dashboard shows by default. Both the alert list and the status endpoint
+# ask for it, so the statement is built once here rather than on every request.
+LATEST_SESSION_DATE = select(func.max(Alert.session_date)).where(
+    Alert.session_date.isnot(None)
+)
+
 
 @router.get("/alerts", response_model=ScannerAlertListResponse)
 async def list_scanner_alerts(
@@ -54,9 +60,7 @@ async def list_scanner_alerts(
     """Alerts for a trading session, strongest confidence first."""
     target_date = session_date
     if target_date is None:
-        target_date = await db.scalar(
-            select(func.max(Alert.session_date)).where(Alert.session_date.isnot(None))
-        )
+        target_date = await db.scalar(LATEST_SESSION_DATE)
 
     if target_date is None:
         return ScannerAlertListResponse(items=[], total=0, session_date=None)
@@ -124,17 +128,21 @@ async def get_scanner_status(db: AsyncSession = Depends(get_db)) -> ScannerStatu
     last_run = recent[0] if recent else None
     last_success = next((r for r in recent if r.status == ScanRunStatus.COMPLETED), None)
 
-    session_date = await db.scalar(
-        select(func.max(Alert.session_date)).where(Alert.session_date.isnot(None))
-    )
-    alert_count = 0
-    if session_date is not None:
-        alert_count = (
-            await db.scalar(
-                select(func.count(Alert.id)).where(Alert.session_date == session_date)
+    # Latest session and its alert count in one round trip. A single AsyncSession cannot
+    # run statements concurrently, so folding them into one SELECT is the way to stop
+    # paying for them one after the other.
+    latest = LATEST_SESSION_DATE.scalar_subquery()
+    session_date, alert_count = (
+        await db.execute(
+            select(
+                latest,
+                select(func.count(Alert.id))
+                .where(Alert.session_date == latest)
+                .scalar_subquery(),
             )
-            or 0
         )
+    ).one()
+    alert_count = alert_count or 0
 
     if last_run is None:
         state, detail, healthy = (
@@ -74,8 +74,10 @@ class ConnectionManager:
         if channel not in self.subscriptions:
             return
 
+        # Iterate a snapshot: each send yields to the event loop, and a client that
+        # subscribes or disconnects meanwhile would otherwise resize the set mid-loop.
         disconnected = []
-        for conn_id in self.subscriptions[channel]:
+        for conn_id in list(self.subscriptions[channel]):
             if conn_id in self.active_connections:
                 try:
                     await self.active_connections[conn_id].send_json(message)
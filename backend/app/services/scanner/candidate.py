@@ -15,7 +15,9 @@ STAGE_3 = "stage_3_room_to_run"
 STAGE_RISK = "risk_filters"
 
 
-@dataclass
+# Candidate and Rejection are slotted: a scan makes one per ticker that clears Stage 1
+# and one per ticker that drops out, and nothing attaches ad-hoc attributes to either.
+@dataclass(slots=True)
 class Candidate:
     """A ticker under evaluation, carrying every value the stages compute."""
 
@@ -95,7 +97,7 @@ class Candidate:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rejection:
     """Why one ticker stopped advancing."""
 
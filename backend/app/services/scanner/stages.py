@@ -27,7 +27,7 @@ displayed number and the decision agree.
 import logging
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.reference_data import ReferenceData
@@ -97,15 +97,19 @@ async def stage_1_liquidity(
 async def stage_1_universe_size(
     session: AsyncSession, tickers: list[str] | None = None
 ) -> int:
-    """How many tickers Stage 1 considered — the denominator for the stage counts."""
+    """How many tickers Stage 1 considered — the denominator for the stage counts.
+
+    Counted in the database: only the number is needed, not the active ticker list.
+    """
     stmt = (
-        select(ReferenceData.ticker)
+        select(func.count())
+        .select_from(ReferenceData)
         .join(Universe, Universe.ticker == ReferenceData.ticker)
         .where(Universe.is_active.is_(True))
     )
     if tickers:
         stmt = stmt.where(ReferenceData.ticker.in_([t.upper() for t in tickers]))
-    return len((await session.execute(stmt)).scalars().all())
+    return (await session.execute(stmt)).scalar_one()
 
 
 def _to_candidate(row: ReferenceData) -> Candidate:
@@ -141,9 +145,10 @@ def stage_2_momentum(
     a quiet market. That must surface as a failed scan instead.
     """
     outcome = StageOutcome()
+    profiles = profiles or {}
 
     for candidate in candidates:
-        vol_profile = (profiles or {}).get(candidate.ticker)
+        vol_profile = profiles.get(candidate.ticker)
         snapshot = snapshots.get(candidate.ticker)
         if snapshot is None:
             outcome.rejections.append(
@@ -265,7 +270,8 @@ def stage_3_room_to_run(
             )
             continue
 
-        above = {name: level for name, level in candidate.resistance_levels().items() if level > price}
+        levels = candidate.resistance_levels()
+        above = {name: level for name, level in levels.items() if level > price}
         if not above:
             outcome.rejections.append(
                 Rejection(
@@ -273,7 +279,7 @@ def stage_3_room_to_run(
                     STAGE_3,
                     "no resistance above price",
                     f"price {price:.2f} is above every known level "
-                    f"({_format_levels(candidate.resistance_levels())}); headroom unmeasurable",
+                    f"({_format_levels(levels)}); headroom unmeasurable",
                 )
             )
             continue
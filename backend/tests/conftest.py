@@ -8,6 +8,7 @@ import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base, get_db
 from app.main import app
@@ -22,11 +23,18 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 @pytest_asyncio.fixture(scope="function")
 async def test_engine():
-    """Create and dispose test engine for each test."""
+    """Create and dispose test engine for each test.
+
+    `StaticPool` pins every session to the one in-memory connection, so the schema built
+    by `test_session_factory` is the schema every session sees. aiosqlite happens to
+    default to this for `:memory:`; the fixtures depend on it, so it is stated here.
+    """
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
     yield engine
     await engine.dispose()
@@ -34,7 +42,11 @@ async def test_engine():
 
 @pytest_asyncio.fixture(scope="function")
 async def test_session_factory(test_engine):
-    """Create a session factory for integration tests that need to patch async_session_maker."""
+    """Create a session factory for integration tests that need to patch async_session_maker.
+
+    There is no drop_all on teardown: the database lives only in the engine's one
+    connection, and `test_engine` disposes of it straight after, schema and all.
+    """
     # Create all tables
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -47,10 +59,6 @@ async def test_session_factory(test_engine):
 
     yield session_factory
 
-    # Drop all tables after test
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
 
 @pytest_asyncio.fixture(scope="function")
 async def db_session(test_session_factory) -> AsyncGenerator[AsyncSession, None]:
@@ -183,6 +191,10 @@ GOLDEN_REFERENCE_ROWS = [
     ("PENN", 40_000_000, 1_000_000.0, 1.5, 1.55, 2.0, 1.6, 1.4),
 ]
 
+# The evening refresh before the golden session (2026-07-28). Pinned rather than utcnow() so
+# the data-quality factor's reference-age check reads the same on any day the suite runs.
+GOLDEN_COMPUTED_AT = datetime(2026, 7, 27, 22, 0)
+
 GOLDEN_SNAPSHOT_FILE = Path(__file__).parent / "fixtures" / "snapshots" / "golden_session.json"
 
 
@@ -208,7 +220,7 @@ async def golden_reference_data(test_session_factory):
                     sma_200=sma200,
                     bars_used=260,
                     data_source="fixture",
-                    computed_at=datetime.utcnow(),
+                    computed_at=GOLDEN_COMPUTED_AT,
                 )
             )
         await session.commit()
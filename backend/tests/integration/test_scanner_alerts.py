@@ -16,6 +16,7 @@ from app.services.scanner.clock import FixedClock
 from app.services.scanner.pipeline import Scanner
 from app.services.scanner.profiles import demo_profile, production_profile
 from app.services.scanner.rvol import NormalizedRvol, SimpleRvol
+from app.services.scanner.snapshot import FixtureSnapshotProvider
 
 SCAN_AT = datetime(2026, 7, 28, 9, 25)
 EARLIER = datetime(2026, 7, 28, 5, 5)
@@ -217,8 +218,6 @@ async def test_a_failed_scan_persists_nothing(
 async def test_a_quiet_market_persists_nothing_but_is_not_a_failure(
     test_session_factory, golden_reference_data, service
 ):
-    from app.services.scanner.snapshot import FixtureSnapshotProvider
-
     empty = FixtureSnapshotProvider(scenario={"snapshots": {}})
     result, report = await run_and_persist(test_session_factory, empty, service)
 
@@ -241,8 +240,8 @@ async def test_alerts_are_broadcast_on_the_existing_channel(
     assert channel == "alerts"
     assert message["type"] == "scan_alerts"
     assert message["data"]["session_date"] == "2026-07-28"
+    assert {alert["ticker"] for alert in message["data"]["alerts"]} == {"LOWF", "EDGE"}
     assert len(message["data"]["alerts"]) == 2
-    assert message["data"]["alerts"][0]["ticker"] in {"LOWF", "EDGE"}
 
 
 async def test_broadcast_payload_carries_the_demo_flag(
@@ -254,7 +253,8 @@ async def test_broadcast_payload_carries_the_demo_flag(
 
     _, message = broadcaster.messages[0]
     assert message["data"]["is_demo"] is True
-    assert all(alert["is_demo"] for alert in message["data"]["alerts"])
+    # A set, not all(): all() over an empty list passes, and an empty broadcast must not.
+    assert {alert["is_demo"] for alert in message["data"]["alerts"]} == {True}
 
 
 async def test_a_zero_candidate_scan_still_broadcasts(
@@ -263,8 +263,6 @@ async def test_a_zero_candidate_scan_still_broadcasts(
     """A successful scan that finds nothing must still push, or a dashboard showing an
     earlier failure stays stuck on 'SCANNER FAILING' until the next status poll. The
     failure-to-healthy transition is the most important one to deliver promptly."""
-    from app.services.scanner.snapshot import FixtureSnapshotProvider
-
     empty = FixtureSnapshotProvider(scenario={"snapshots": {}})
     result, report = await run_and_persist(test_session_factory, empty, service)
 
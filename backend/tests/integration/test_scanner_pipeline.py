@@ -10,6 +10,7 @@ and a scan that never ran must be three visibly different things — in `scan_ru
 from Phase 3, in the UI.
 """
 
+from dataclasses import replace as dc_replace
 from datetime import datetime
 
 import pytest
@@ -363,8 +364,6 @@ async def test_demo_with_zero_stage_1_survivors_reports_misconfiguration(
     the thresholds are wrong — most often a stored override reverting the loosened float
     cap — and reporting that as a quiet market sends the operator to look at the market
     instead of at their settings."""
-    from dataclasses import replace as dc_replace
-
     # Demo, but with the float cap reverted to production's — exactly what a stored
     # override used to do silently.
     broken = dc_replace(demo_profile(), float_max=1)
@@ -401,8 +400,6 @@ async def test_production_with_zero_stage_1_survivors_is_a_quiet_market(
 ):
     """The same funnel shape in PRODUCTION is expected on the free tier — every symbol
     genuinely fails the real float cap. It must not be flagged as a misconfiguration."""
-    from dataclasses import replace as dc_replace
-
     strict = dc_replace(production_profile(), float_max=1)
     scanner = Scanner(
         session_factory=test_session_factory,
@@ -450,10 +447,7 @@ async def test_risk_filter_vetoes_a_thin_name(
     test_session_factory, golden_snapshot_provider, golden_reference_data
 ):
     """A candidate can clear all three stages and still be blocked as untradeable."""
-    from app.services.scanner.profiles import production_profile as build
-
-    strict = build()
-    strict = type(strict)(**{**strict.__dict__, "dollar_volume_min": 500_000_000.0})
+    strict = dc_replace(production_profile(), dollar_volume_min=500_000_000.0)
     scanner = Scanner(
         session_factory=test_session_factory,
         snapshot_provider=golden_snapshot_provider,
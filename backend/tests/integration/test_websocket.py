@@ -3,12 +3,21 @@
 from unittest.mock import AsyncMock
 
 import pytest
+from fastapi import WebSocket
 from httpx import AsyncClient
+from starlette.testclient import TestClient
 
 from app.api.v1.websocket import ConnectionManager, get_manager
 from app.main import app
 
 
+def make_websocket() -> AsyncMock:
+    """Mock WebSocket; call it directly in tests that need more than one client."""
+    # spec_set: a call to a method the real WebSocket lacks fails here instead of
+    # quietly returning another mock.
+    return AsyncMock(spec_set=WebSocket)
+
+
 class TestConnectionManager:
     """Tests for ConnectionManager class."""
 
@@ -20,13 +29,8 @@ class TestConnectionManager:
     @pytest.fixture
     def mock_websocket(self) -> AsyncMock:
         """Create a mock WebSocket."""
-        ws = AsyncMock()
-        ws.accept = AsyncMock()
-        ws.send_json = AsyncMock()
-        ws.receive_text = AsyncMock()
-        return ws
+        return make_websocket()
 
-    @pytest.mark.asyncio
     async def test_connect(self, manager: ConnectionManager, mock_websocket: AsyncMock):
         """Test WebSocket connection."""
         connection_id = await manager.connect(mock_websocket)
@@ -35,7 +39,6 @@ class TestConnectionManager:
         assert manager.active_connections[connection_id] == mock_websocket
         mock_websocket.accept.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_disconnect(self, manager: ConnectionManager, mock_websocket: AsyncMock):
         """Test WebSocket disconnection."""
         connection_id = await manager.connect(mock_websocket)
@@ -44,7 +47,6 @@ class TestConnectionManager:
         manager.disconnect(connection_id)
         assert connection_id not in manager.active_connections
 
-    @pytest.mark.asyncio
     async def test_disconnect_cleans_subscriptions(
         self, manager: ConnectionManager, mock_websocket: AsyncMock
     ):
@@ -59,7 +61,6 @@ class TestConnectionManager:
         assert connection_id not in manager.subscriptions["alerts"]
         assert connection_id not in manager.active_connections
 
-    @pytest.mark.asyncio
     async def test_subscribe_alerts(
         self, manager: ConnectionManager, mock_websocket: AsyncMock
     ):
@@ -70,8 +71,6 @@ class TestConnectionManager:
 
         assert connection_id in manager.subscriptions["alerts"]
 
-    @pytest.mark.asyncio
-
     async def test_unsubscribe(self, manager: ConnectionManager, mock_websocket: AsyncMock):
         """Test unsubscribing from a channel."""
         connection_id = await manager.connect(mock_websocket)
@@ -81,7 +80,6 @@ class TestConnectionManager:
         manager.unsubscribe(connection_id, "alerts")
         assert connection_id not in manager.subscriptions["alerts"]
 
-    @pytest.mark.asyncio
     async def test_get_subscriptions(
         self, manager: ConnectionManager, mock_websocket: AsyncMock
     ):
@@ -101,7 +99,6 @@ class TestConnectionManager:
         await manager.subscribe(connection_id, "market_data")
         assert manager.get_subscriptions(connection_id) == ["alerts"]
 
-    @pytest.mark.asyncio
     async def test_send_personal(
         self, manager: ConnectionManager, mock_websocket: AsyncMock
     ):
@@ -113,7 +110,6 @@ class TestConnectionManager:
 
         mock_websocket.send_json.assert_called_once_with(message)
 
-    @pytest.mark.asyncio
     async def test_send_personal_disconnects_on_error(
         self, manager: ConnectionManager, mock_websocket: AsyncMock
     ):
@@ -125,7 +121,6 @@ class TestConnectionManager:
 
         assert connection_id not in manager.active_connections
 
-    @pytest.mark.asyncio
     async def test_broadcast_to_channel(
         self, manager: ConnectionManager, mock_websocket: AsyncMock
     ):
@@ -138,16 +133,9 @@ class TestConnectionManager:
 
         mock_websocket.send_json.assert_called_with(message)
 
-    @pytest.mark.asyncio
     async def test_broadcast_to_channel_multiple_clients(self, manager: ConnectionManager):
         """Test broadcasting to multiple channel subscribers."""
-        ws1 = AsyncMock()
-        ws1.accept = AsyncMock()
-        ws1.send_json = AsyncMock()
-
-        ws2 = AsyncMock()
-        ws2.accept = AsyncMock()
-        ws2.send_json = AsyncMock()
+        ws1, ws2 = make_websocket(), make_websocket()
 
         conn_id1 = await manager.connect(ws1)
         conn_id2 = await manager.connect(ws2)
@@ -161,18 +149,9 @@ class TestConnectionManager:
         ws1.send_json.assert_called_with(message)
         ws2.send_json.assert_called_with(message)
 
-    @pytest.mark.asyncio
-    async def test_broadcast_to_channel_unsubscribed_not_reached(
-        self, manager: ConnectionManager
-    ):
+    async def test_broadcast_to_channel_unsubscribed_not_reached(self, manager: ConnectionManager):
         """Test that unsubscribed clients don't receive broadcasts."""
-        ws1 = AsyncMock()
-        ws1.accept = AsyncMock()
-        ws1.send_json = AsyncMock()
-
-        ws2 = AsyncMock()
-        ws2.accept = AsyncMock()
-        ws2.send_json = AsyncMock()
+        ws1, ws2 = make_websocket(), make_websocket()
 
         conn_id1 = await manager.connect(ws1)
         await manager.connect(ws2)  # connected but never subscribed
@@ -186,19 +165,10 @@ class TestConnectionManager:
         ws1.send_json.assert_called_with(message)
         ws2.send_json.assert_not_called()
 
-
-    @pytest.mark.asyncio
-    async def test_broadcast_cleans_up_disconnected_clients(
-        self, manager: ConnectionManager
-    ):
+    async def test_broadcast_cleans_up_disconnected_clients(self, manager: ConnectionManager):
         """Test that broadcast cleans up disconnected clients."""
-        ws1 = AsyncMock()
-        ws1.accept = AsyncMock()
-        ws1.send_json = AsyncMock()
-
-        ws2 = AsyncMock()
-        ws2.accept = AsyncMock()
-        ws2.send_json = AsyncMock(side_effect=Exception("Disconnected"))
+        ws1, ws2 = make_websocket(), make_websocket()
+        ws2.send_json.side_effect = Exception("Disconnected")
 
         conn_id1 = await manager.connect(ws1)
         conn_id2 = await manager.connect(ws2)
@@ -213,151 +183,135 @@ class TestConnectionManager:
         assert conn_id1 in manager.active_connections
         assert conn_id2 not in manager.active_connections
 
+    async def test_broadcast_survives_a_subscribe_during_a_send(self, manager: ConnectionManager):
+        """A client subscribing while a broadcast awaits a send must not break the loop."""
+        ws1, ws2, late = make_websocket(), make_websocket(), make_websocket()
+        conn_id1 = await manager.connect(ws1)
+        conn_id2 = await manager.connect(ws2)
+        late_id = await manager.connect(late)
+        await manager.subscribe(conn_id1, "alerts")
+        await manager.subscribe(conn_id2, "alerts")
+
+        async def subscribe_late(message):
+            await manager.subscribe(late_id, "alerts")
+
+        ws1.send_json.side_effect = subscribe_late
+
+        message = {"type": "alert", "data": {}}
+        await manager.broadcast_to_channel("alerts", message)
+
+        ws2.send_json.assert_called_with(message)
+        late.send_json.assert_not_called()  # joined after this broadcast started
+        assert late_id in manager.subscriptions["alerts"]
+
 
 class TestWebSocketEndpoint:
     """Integration tests for WebSocket endpoint."""
 
     @pytest.fixture
-    def anyio_backend(self):
-        return "asyncio"
-
-    @pytest.mark.asyncio
-    async def test_websocket_connection(self, client: AsyncClient):
-        """Test WebSocket connection and initial status message."""
-        from starlette.testclient import TestClient
-
+    def websocket(self, client: AsyncClient):
+        """A live connection to `/api/v1/ws`; its initial status message is still unread."""
         with TestClient(app) as test_client:
             with test_client.websocket_connect("/api/v1/ws") as websocket:
-                # Should receive initial status message
-                data = websocket.receive_json()
-                assert data["type"] == "status"
-                assert data["data"]["connected"] is True
-                assert "connection_id" in data["data"]
-                assert data["data"]["subscriptions"] == []
-
-    @pytest.mark.asyncio
-    async def test_websocket_subscribe(self, client: AsyncClient):
-        """Test subscribing to a channel."""
-        from starlette.testclient import TestClient
+                yield websocket
 
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                # Receive initial status
-                websocket.receive_json()
+    async def test_websocket_connection(self, websocket):
+        """Test WebSocket connection and initial status message."""
+        # Should receive initial status message
+        data = websocket.receive_json()
+        assert data["type"] == "status"
+        assert data["data"]["connected"] is True
+        assert "connection_id" in data["data"]
+        assert data["data"]["subscriptions"] == []
+
+    async def test_websocket_subscribe(self, websocket):
+        """Test subscribing to a channel."""
+        # Receive initial status
+        websocket.receive_json()
 
-                # Subscribe to alerts
-                websocket.send_json({"action": "subscribe", "channel": "alerts"})
+        # Subscribe to alerts
+        websocket.send_json({"action": "subscribe", "channel": "alerts"})
 
-                # Should receive subscription confirmation
-                data = websocket.receive_json()
-                assert data["type"] == "status"
-                assert data["data"]["subscribed"] == "alerts"
-                assert "alerts" in data["data"]["subscriptions"]
+        # Should receive subscription confirmation
+        data = websocket.receive_json()
+        assert data["type"] == "status"
+        assert data["data"]["subscribed"] == "alerts"
+        assert "alerts" in data["data"]["subscriptions"]
 
-    @pytest.mark.asyncio
-    async def test_websocket_unsubscribe(self, client: AsyncClient):
+    async def test_websocket_unsubscribe(self, websocket):
         """Test unsubscribing from a channel."""
-        from starlette.testclient import TestClient
+        websocket.receive_json()  # Initial status
 
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                websocket.receive_json()  # Initial status
-
-                # Subscribe
-                websocket.send_json({"action": "subscribe", "channel": "alerts"})
-                websocket.receive_json()  # Subscription confirmation
+        # Subscribe
+        websocket.send_json({"action": "subscribe", "channel": "alerts"})
+        websocket.receive_json()  # Subscription confirmation
 
-                # Unsubscribe
-                websocket.send_json({"action": "unsubscribe", "channel": "alerts"})
+        # Unsubscribe
+        websocket.send_json({"action": "unsubscribe", "channel": "alerts"})
 
-                data = websocket.receive_json()
-                assert data["type"] == "status"
-                assert data["data"]["unsubscribed"] == "alerts"
-                assert "alerts" not in data["data"]["subscriptions"]
+        data = websocket.receive_json()
+        assert data["type"] == "status"
+        assert data["data"]["unsubscribed"] == "alerts"
+        assert "alerts" not in data["data"]["subscriptions"]
 
-    @pytest.mark.asyncio
-    async def test_websocket_ping_pong(self, client: AsyncClient):
+    async def test_websocket_ping_pong(self, websocket):
         """Test ping/pong functionality."""
-        from starlette.testclient import TestClient
-
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                websocket.receive_json()  # Initial status
+        websocket.receive_json()  # Initial status
 
-                # Send ping
-                websocket.send_json({"action": "ping"})
+        # Send ping
+        websocket.send_json({"action": "ping"})
 
-                # Should receive pong
-                data = websocket.receive_json()
-                assert data["type"] == "pong"
-                assert "timestamp" in data["data"]
+        # Should receive pong
+        data = websocket.receive_json()
+        assert data["type"] == "pong"
+        assert "timestamp" in data["data"]
 
-    @pytest.mark.asyncio
-    async def test_websocket_invalid_json(self, client: AsyncClient):
+    async def test_websocket_invalid_json(self, websocket):
         """Test handling of invalid JSON."""
-        from starlette.testclient import TestClient
+        websocket.receive_json()  # Initial status
 
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                websocket.receive_json()  # Initial status
-
-                # Send invalid JSON
-                websocket.send_text("not valid json{")
+        # Send invalid JSON
+        websocket.send_text("not valid json{")
 
-                # Should receive error
-                data = websocket.receive_json()
-                assert data["type"] == "error"
-                assert data["data"]["code"] == "INVALID_JSON"
+        # Should receive error
+        data = websocket.receive_json()
+        assert data["type"] == "error"
+        assert data["data"]["code"] == "INVALID_JSON"
 
-    @pytest.mark.asyncio
-    async def test_websocket_unknown_action(self, client: AsyncClient):
+    async def test_websocket_unknown_action(self, websocket):
         """Test handling of unknown action."""
-        from starlette.testclient import TestClient
-
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                websocket.receive_json()  # Initial status
+        websocket.receive_json()  # Initial status
 
-                # Send unknown action
-                websocket.send_json({"action": "unknown_action"})
+        # Send unknown action
+        websocket.send_json({"action": "unknown_action"})
 
-                # Should receive error
-                data = websocket.receive_json()
-                assert data["type"] == "error"
-                assert data["data"]["code"] == "UNKNOWN_ACTION"
+        # Should receive error
+        data = websocket.receive_json()
+        assert data["type"] == "error"
+        assert data["data"]["code"] == "UNKNOWN_ACTION"
 
-    @pytest.mark.asyncio
-    async def test_websocket_subscribe_missing_channel(self, client: AsyncClient):
+    async def test_websocket_subscribe_missing_channel(self, websocket):
         """Test subscribe without channel."""
-        from starlette.testclient import TestClient
+        websocket.receive_json()  # Initial status
 
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                websocket.receive_json()  # Initial status
-
-                # Subscribe without channel
-                websocket.send_json({"action": "subscribe"})
+        # Subscribe without channel
+        websocket.send_json({"action": "subscribe"})
 
-                # Should receive error
-                data = websocket.receive_json()
-                assert data["type"] == "error"
-                assert data["data"]["code"] == "MISSING_CHANNEL"
+        # Should receive error
+        data = websocket.receive_json()
+        assert data["type"] == "error"
+        assert data["data"]["code"] == "MISSING_CHANNEL"
 
-    @pytest.mark.asyncio
-    async def test_websocket_subscribe_to_unknown_channel_is_ignored(self, client: AsyncClient):
+    async def test_websocket_subscribe_to_unknown_channel_is_ignored(self, websocket):
         """The per-symbol `market_data` channel went with the Alpaca stream manager.
         Subscribing to it must not silently create a channel nothing ever publishes to."""
-        from starlette.testclient import TestClient
-
-        with TestClient(app) as test_client:
-            with test_client.websocket_connect("/api/v1/ws") as websocket:
-                websocket.receive_json()  # Initial status
+        websocket.receive_json()  # Initial status
 
-                websocket.send_json({"action": "subscribe", "channel": "market_data"})
+        websocket.send_json({"action": "subscribe", "channel": "market_data"})
 
-                data = websocket.receive_json()
-                assert data["type"] == "status"
-                assert data["data"]["subscriptions"] == []
+        data = websocket.receive_json()
+        assert data["type"] == "status"
+        assert data["data"]["subscriptions"] == []
 
 
 class TestGetManager:
@@ -9,6 +9,7 @@ from datetime import date, datetime
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, select
 
 from app.models.alert import Alert
 from app.models.scan_run import ScanRun, ScanRunStatus
@@ -26,8 +27,7 @@ async def scanner_alert(db_session):
         stage_counts_json={"counts": {"universe": 11, "stage_1_liquidity": 7}},
     )
     db_session.add(run)
-    await db_session.commit()
-    await db_session.refresh(run)
+    await db_session.flush()  # assigns run.id; the alert's commit below covers both rows
 
     alert = Alert(
         ticker="LOWF",
@@ -84,14 +84,17 @@ async def test_list_alerts_returns_the_v2_contract(client: AsyncClient, scanner_
     assert body["total"] == 1
 
     item = body["items"][0]
-    # Storage and contract now agree on `ticker`; the mapping layer is gone.
-    assert item["ticker"] == "LOWF"
+    expected = {
+        # Storage and contract now agree on `ticker`; the mapping layer is gone.
+        "ticker": "LOWF",
+        "gap_pct": 5.0,
+        "upside_pct": 14.29,
+        "rvol_is_approximate": True,
+        "suggested_entry_window": "09:30-10:00 ET",
+        "catalyst": None,
+    }
+    assert {key: item[key] for key in expected} == expected
     assert "symbol" not in item
-    assert item["gap_pct"] == 5.0
-    assert item["upside_pct"] == 14.29
-    assert item["rvol_is_approximate"] is True
-    assert item["suggested_entry_window"] == "09:30-10:00 ET"
-    assert item["catalyst"] is None
 
 
 async def test_alert_carries_the_score_breakdown(client: AsyncClient, scanner_alert):
@@ -153,12 +156,56 @@ async def test_null_upside_serialises_as_null_not_zero(client: AsyncClient, db_s
     assert item["nearest_resistance"] is None
 
 
-async def test_mark_alert_read(client: AsyncClient, scanner_alert):
+async def test_alert_list_query_count_does_not_grow_with_rows(
+    client: AsyncClient, db_session, test_engine
+):
+    """The list must cost the same queries however many alerts a session has.
+
+    Catches a per-row `await db.execute(...)` or `db.scalar(...)` added to the handler:
+    the response would stay correct while the query count grew with the alert list.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        counts = []
+        for batch in (1, 20):
+            db_session.add_all(
+                Alert(
+                    ticker=f"T{batch}{i:02d}",
+                    session_date=SESSION,
+                    timestamp=datetime(2026, 7, 28, 13, 25),
+                    profile="production",
+                    confidence_score=0.5,
+                )
+                for i in range(batch)
+            )
+            await db_session.commit()
+
+            statements.clear()
+            assert (await client.get("/api/v1/scanner/alerts")).status_code == 200
+            counts.append(len(statements))
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert counts[0] == counts[1]
+
+
+async def test_mark_alert_read(client: AsyncClient, scanner_alert, test_session_factory):
     response = await client.post(f"/api/v1/scanner/alerts/{scanner_alert.id}/read")
 
     assert response.status_code == 200
     assert response.json()["is_read"] is True
 
+    # Read the row back from the database: the flag must be written, not just echoed.
+    async with test_session_factory() as session:
+        assert await session.scalar(
+            select(Alert.is_read).where(Alert.id == scanner_alert.id)
+        ) is True
+
 
 async def test_missing_alert_is_404(client: AsyncClient):
     assert (await client.get("/api/v1/scanner/alerts/9999")).status_code == 404
@@ -219,38 +266,40 @@ async def test_status_reports_candidates_when_alerts_exist(
 
     assert body["state"] == "ok_with_candidates"
     assert body["alert_count"] == 1
-
-
-async def test_a_run_stuck_in_running_is_treated_as_failed(client: AsyncClient, db_session):
-    """A process that died mid-scan must not look healthy."""
-    db_session.add(
-        ScanRun(
-            started_at=datetime(2026, 7, 28, 13, 25),
-            status=ScanRunStatus.RUNNING,
-            profile="production",
-        )
-    )
-    await db_session.commit()
-
-    body = (await client.get("/api/v1/scanner/status")).json()
-    assert body["state"] == "failed"
-    assert body["is_healthy"] is False
-
-
-async def test_skipped_run_is_healthy_but_distinct(client: AsyncClient, db_session):
+    assert body["session_date"] == scanner_alert.session_date.isoformat()
+
+
+@pytest.mark.parametrize(
+    "status, started_at, finished_at, state, healthy",
+    [
+        # A process that died mid-scan must not look healthy.
+        (ScanRunStatus.RUNNING, datetime(2026, 7, 28, 13, 25), None, "failed", False),
+        # Outside the window: nothing ran, nothing broke.
+        (
+            ScanRunStatus.SKIPPED,
+            datetime(2026, 7, 28, 20, 0),
+            datetime(2026, 7, 28, 20, 0, 1),
+            "skipped",
+            True,
+        ),
+    ],
+)
+async def test_status_for_a_run_that_produced_no_scan(
+    client: AsyncClient, db_session, status, started_at, finished_at, state, healthy
+):
     db_session.add(
         ScanRun(
-            started_at=datetime(2026, 7, 28, 20, 0),
-            finished_at=datetime(2026, 7, 28, 20, 0, 1),
-            status=ScanRunStatus.SKIPPED,
+            started_at=started_at,
+            finished_at=finished_at,
+            status=status,
             profile="production",
         )
     )
     await db_session.commit()
 
     body = (await client.get("/api/v1/scanner/status")).json()
-    assert body["state"] == "skipped"
-    assert body["is_healthy"] is True
+    assert body["state"] == state
+    assert body["is_healthy"] is healthy
 
 
 async def test_scan_runs_list(client: AsyncClient, scanner_alert):
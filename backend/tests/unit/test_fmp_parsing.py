@@ -22,9 +22,13 @@ def test_success_returns_payload_untouched():
     assert interpret(RawResponse(200, payload), endpoint="quote") is payload
 
 
-def test_http_429_is_rate_limited():
-    with pytest.raises(RateLimited):
-        interpret(RawResponse(429, {}), endpoint="quote")
+@pytest.mark.parametrize(
+    "status, error",
+    [(429, RateLimited), (500, TransientError), (503, TransientError), (302, MalformedResponse)],
+)
+def test_bodiless_status_alone_decides_the_error(status, error):
+    with pytest.raises(error):
+        interpret(RawResponse(status, {}), endpoint="quote")
 
 
 def test_limit_reach_message_on_200_is_rate_limited():
@@ -82,16 +86,6 @@ def test_403_without_symbol_is_auth_failed():
         interpret(RawResponse(403, payload), endpoint="company-screener")
 
 
-def test_500_is_transient():
-    with pytest.raises(TransientError):
-        interpret(RawResponse(503, {}), endpoint="quote")
-
-
-def test_unexpected_status_is_malformed():
-    with pytest.raises(MalformedResponse):
-        interpret(RawResponse(302, {}), endpoint="quote")
-
-
 def test_extract_error_message_ignores_non_error_payloads():
     assert extract_error_message([{"symbol": "AAPL"}]) is None
     assert extract_error_message({"symbol": "AAPL"}) is None
@@ -25,9 +25,12 @@ outcome. Stage 3 still computes upside exactly as before.
 
 import pytest
 
+from app.config import Settings
+from app.services.scanner import risk as risk_module
 from app.services.scanner.candidate import STAGE_RISK, Candidate
 from app.services.scanner.profiles import production_profile
 from app.services.scanner.risk import (
+    DATA_QUALITY_REASONS,
     REASON_IMPLAUSIBLE_UPSIDE,
     REASON_PRICE_REGIME_BREAK,
     MarketTape,
@@ -62,6 +65,17 @@ def run(*candidates):
     return apply_risk_filters(list(candidates), production_profile(), NEUTRAL)
 
 
+@pytest.fixture
+def risk_settings(monkeypatch):
+    """Point the risk module at a Settings carrying the given overrides."""
+
+    def override(**fields):
+        settings = Settings(database_url="postgresql+asyncpg://u:p@localhost:5432/db", **fields)
+        monkeypatch.setattr(risk_module, "get_settings", lambda: settings)
+
+    return override
+
+
 # ------------------------------------------------------------------ the ordinary case
 
 
@@ -95,13 +109,8 @@ def test_ffai_shaped_upside_is_rejected_with_a_named_reason():
     assert "540" in rejection.detail
 
 
-def test_the_upside_ceiling_is_configurable(monkeypatch):
-    from app.config import Settings
-    from app.services.scanner import risk as risk_module
-
-    monkeypatch.setattr(risk_module, "get_settings", lambda: Settings(
-        database_url="postgresql+asyncpg://u:p@localhost:5432/db", scan_upside_max=20.0
-    ))
+def test_the_upside_ceiling_is_configurable(risk_settings):
+    risk_settings(scan_upside_max=20.0)
 
     outcome = run(candidate(upside=50.0, high_20d=11.0))
 
@@ -131,14 +140,8 @@ def test_a_collapsed_price_is_rejected_even_when_upside_looks_reasonable():
     assert "16.8x" in outcome.rejections[0].detail
 
 
-def test_the_regime_ratio_is_configurable(monkeypatch):
-    from app.config import Settings
-    from app.services.scanner import risk as risk_module
-
-    monkeypatch.setattr(risk_module, "get_settings", lambda: Settings(
-        database_url="postgresql+asyncpg://u:p@localhost:5432/db",
-        scan_price_regime_break_ratio=1.5,
-    ))
+def test_the_regime_ratio_is_configurable(risk_settings):
+    risk_settings(scan_price_regime_break_ratio=1.5)
 
     outcome = run(candidate(close=10.0, high_20d=20.0, upside=8.0))
 
@@ -160,8 +163,6 @@ def test_data_quality_rejections_are_distinguishable_from_ordinary_ones():
     """'3 candidates suppressed for implausible reference data' is information; a silent
     drop is not. The reasons are named constants so the CLI and scan_runs can separate
     them from a gap or rvol rejection."""
-    from app.services.scanner.risk import DATA_QUALITY_REASONS
-
     outcome = run(
         candidate("GOOD"),
         candidate("FFAI", price=4.83, close=4.63, upside=540.64, high_20d=32.17),
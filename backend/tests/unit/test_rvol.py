@@ -173,18 +173,18 @@ def et(hour: int, minute: int) -> datetime:
     return datetime(2026, 8, 6, hour, minute)
 
 
-def test_matching_volume_scores_about_one_hundred_percent():
+@pytest.mark.parametrize("hour, minute", [(4, 30), (6, 0), (8, 15), (9, 25)])
+def test_matching_volume_scores_about_one_hundred_percent(hour, minute):
     """DoD: live volume equal to the profile must read ~100%, not 80% or 120%."""
-    for hour, minute in [(4, 30), (6, 0), (8, 15), (9, 25)]:
-        bucket = (hour - 4) * 60 + minute
-        expected = profile_curve()[bucket - bucket % 5]
-        result = NormalizedRvol().compute(context(
-            volume_premarket_accumulated=expected,
-            as_of=et(hour, minute),
-            settled_through=et(hour, minute),
-            premarket_volume_profile=profile_curve(),
-        ))
-        assert result.rvol_pct == pytest.approx(100.0), f"at {hour:02d}:{minute:02d}"
+    bucket = (hour - 4) * 60 + minute
+    expected = profile_curve()[bucket - bucket % 5]
+    result = NormalizedRvol().compute(context(
+        volume_premarket_accumulated=expected,
+        as_of=et(hour, minute),
+        settled_through=et(hour, minute),
+        premarket_volume_profile=profile_curve(),
+    ))
+    assert result.rvol_pct == pytest.approx(100.0)
 
 
 def test_the_denominator_follows_settled_through_not_as_of():
@@ -137,19 +137,17 @@ async def test_clear_falls_back_to_the_environment(store):
 # ------------------------------------------------------------------ validation
 
 
-def test_unknown_threshold_is_rejected():
-    with pytest.raises(InvalidThresholdOverrideError, match="Unknown threshold"):
-        validate_overrides({"moon_phase": 3})
-
-
-def test_negative_threshold_is_rejected():
-    with pytest.raises(InvalidThresholdOverrideError, match="cannot be negative"):
-        validate_overrides({"gap_min": -1})
-
-
-def test_non_numeric_threshold_is_rejected():
-    with pytest.raises(InvalidThresholdOverrideError, match="must be a number"):
-        validate_overrides({"gap_min": "soon"})
+@pytest.mark.parametrize(
+    "overrides, reason",
+    [
+        ({"moon_phase": 3}, "Unknown threshold"),
+        ({"gap_min": -1}, "cannot be negative"),
+        ({"gap_min": "soon"}, "must be a number"),
+    ],
+)
+def test_a_malformed_threshold_is_rejected(overrides, reason):
+    with pytest.raises(InvalidThresholdOverrideError, match=reason):
+        validate_overrides(overrides)
 
 
 def test_inverted_gap_band_is_rejected_with_the_reason():
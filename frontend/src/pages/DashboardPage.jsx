@@ -45,8 +45,17 @@ export default function DashboardPage() {
   useEffect(() => {
     fetchAlerts();
     fetchStatus();
-    const interval = setInterval(fetchStatus, 60000);
-    return () => clearInterval(interval);
+    // No polling while the tab is hidden; refresh as soon as it is shown again, so a
+    // phone unlocked at the open never shows a status up to a minute stale.
+    const poll = () => {
+      if (!document.hidden) fetchStatus();
+    };
+    const interval = setInterval(poll, 60000);
+    document.addEventListener('visibilitychange', poll);
+    return () => {
+      clearInterval(interval);
+      document.removeEventListener('visibilitychange', poll);
+    };
   }, [fetchAlerts, fetchStatus]);
 
   const unreadCount = alerts.filter((a) => !a.is_read).length;
@@ -0,0 +1,92 @@
+/**
+ * Tests for the session view's status polling.
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { render, act } from '@testing-library/react';
+import { MemoryRouter } from 'react-router-dom';
+import DashboardPage from '../../pages/DashboardPage';
+import { useScannerStore } from '../../store';
+
+vi.mock('../../store', () => ({
+  useScannerStore: vi.fn(),
+}));
+
+const POLL_MS = 60000;
+
+describe('DashboardPage status polling', () => {
+  let hidden;
+  let fetchStatus;
+
+  const setHidden = (value) => {
+    hidden = value;
+    document.dispatchEvent(new Event('visibilitychange'));
+  };
+
+  const renderPage = () =>
+    render(
+      <MemoryRouter>
+        <DashboardPage />
+      </MemoryRouter>
+    );
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    hidden = false;
+    // jsdom defines `hidden` on Document.prototype; shadow it on the instance.
+    Object.defineProperty(document, 'hidden', { configurable: true, get: () => hidden });
+
+    fetchStatus = vi.fn();
+    useScannerStore.mockReturnValue({
+      alerts: [],
+      sessionDate: null,
+      hasDemoAlerts: false,
+      status: null,
+      loading: false,
+      error: null,
+      fetchAlerts: vi.fn(),
+      fetchStatus,
+      markRead: vi.fn(),
+    });
+  });
+
+  afterEach(() => {
+    delete document.hidden;
+    vi.useRealTimers();
+    vi.clearAllMocks();
+  });
+
+  it('polls once a minute while the tab is visible', () => {
+    renderPage();
+    expect(fetchStatus).toHaveBeenCalledTimes(1); // on mount
+
+    act(() => vi.advanceTimersByTime(POLL_MS));
+    expect(fetchStatus).toHaveBeenCalledTimes(2);
+  });
+
+  it('skips the tick while the tab is hidden', () => {
+    renderPage();
+    act(() => setHidden(true));
+
+    act(() => vi.advanceTimersByTime(POLL_MS));
+    expect(fetchStatus).toHaveBeenCalledTimes(1);
+  });
+
+  it('refreshes once when the tab becomes visible again', () => {
+    renderPage();
+    act(() => setHidden(true));
+    act(() => vi.advanceTimersByTime(POLL_MS));
+
+    act(() => setHidden(false));
+    expect(fetchStatus).toHaveBeenCalledTimes(2);
+  });
+
+  it('removes the visibility listener on unmount', () => {
+    const { unmount } = renderPage();
+    unmount();
+
+    act(() => setHidden(false));
+    act(() => vi.advanceTimersByTime(POLL_MS));
+    expect(fetchStatus).toHaveBeenCalledTimes(1);
+  });
+});